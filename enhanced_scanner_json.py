@@ -4,32 +4,128 @@ Enhanced Content Scanner using ripgrep and JSON configuration
 This script provides better detection with fewer false positives
 """
 
+import base64
+import fnmatch
+import functools
+import hashlib
 import json
 import os
 import subprocess
 import argparse
 import re
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Optional, Pattern, Tuple
 import csv
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    import orjson  # Optional: much faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan  # Optional: in-process multi-pattern matching
+except ImportError:
+    hyperscan = None
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def json_dumps_indented(obj) -> bytes:
+    """Serialize to UTF-8 JSON indented by two spaces, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+class Finding(NamedTuple):
+    """A single pattern match in a scanned file"""
+    file_path: str
+    line_number: int
+    category: str
+    pattern_found: str
+    line_content: str
+    matched_text: str
 
 def load_config(config_path):
     """Load configuration from JSON file"""
-    if not os.path.exists(config_path):
+    config_file = Path(config_path)
+    if not config_file.exists():
         print(f"Error: Configuration file not found at {config_path}")
         exit(1)
 
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        config = json_loads(config_file.read_bytes())
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in configuration file: {e}")
         exit(1)
 
+    try:
+        literals, regex_patterns = split_ignore_patterns(config.get('ignore_line_patterns', []))
+        config['_ignore_literals'] = literals
+        config['_ignore_regexes'] = compile_ignore_patterns(regex_patterns)
+    except re.error as e:
+        print(f"Error: Invalid regex in ignore_line_patterns: {e}")
+        exit(1)
+
+    return config
+
+# Characters that give an ignore pattern regex meaning
+REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+def split_ignore_patterns(ignore_patterns: List[str]) -> Tuple[Tuple[bytes, ...], List[str]]:
+    """Split ignore patterns into lowercased ASCII literals and real regexes"""
+    literals = []
+    regex_patterns = []
+    for pattern in ignore_patterns:
+        if pattern.isascii() and not REGEX_METACHARACTERS.intersection(pattern):
+            literals.append(pattern.lower().encode('ascii'))
+        else:
+            regex_patterns.append(pattern)
+    return tuple(literals), regex_patterns
+
+# Inline flags such as (?i), which apply to the whole expression
+GLOBAL_FLAGS_REGEX = re.compile(r'\(\?[aiLmsux]+\)')
+
+def can_fuse_ignore_pattern(pattern: str, regex: Pattern[str]) -> bool:
+    """Check whether a pattern keeps its meaning inside a (?:...) alternation;
+    global flags must lead the expression and group numbers would shift"""
+    return regex.groups == 0 and GLOBAL_FLAGS_REGEX.search(pattern) is None
+
+def compile_ignore_patterns(ignore_patterns: List[str]) -> Tuple[Pattern[str], ...]:
+    """Compile ignore patterns as case-insensitive regexes, fusing those that
+    can share a single alternation into one regex"""
+    # Compile each pattern on its own first so a bad one is reported as written
+    compiled = [re.compile(pattern, re.IGNORECASE) for pattern in ignore_patterns]
+
+    fusable = [pattern for pattern, regex in zip(ignore_patterns, compiled) if can_fuse_ignore_pattern(pattern, regex)]
+    if len(fusable) < 2:
+        return tuple(compiled)
+
+    standalone = tuple(regex for pattern, regex in zip(ignore_patterns, compiled)
+                       if not can_fuse_ignore_pattern(pattern, regex))
+    fused = re.compile('|'.join(f'(?:{pattern})' for pattern in fusable), re.IGNORECASE)
+    return (fused, *standalone)
+
+def repo_clone_path(repo_url, repos_dir) -> Path:
+    """Directory a repository URL is cloned into"""
+    return Path(repos_dir) / repo_url.split("/")[-1].replace(".git", "")
+
 def clone_repo(repo_url, repos_dir):
     """Clone repository if it doesn't exist"""
-    repo_name = repo_url.split("/")[-1].replace(".git", "")
-    repo_path = os.path.join(repos_dir, repo_name)
+    repo_path = repo_clone_path(repo_url, repos_dir)
+    repo_name = repo_path.name
+    # Subprocesses and findings use the plain string form
+    repo_path_str = str(repo_path)
 
     # Convert HTTPS to SSH if needed
     actual_clone_url = repo_url
@@ -38,10 +134,13 @@ def clone_repo(repo_url, repos_dir):
         if not actual_clone_url.endswith(".git"):
             actual_clone_url += ".git"
 
-    if not os.path.exists(repo_path):
+    if not repo_path.exists():
         print(f"Cloning {actual_clone_url}...")
         try:
-            subprocess.run(["git", "clone", actual_clone_url, repo_path],
+            # Only the working tree is scanned, so skip history, tags and
+            # other branches
+            subprocess.run(["git", "clone", "--depth", "1", "--filter=blob:none",
+                            "--single-branch", "--no-tags", actual_clone_url, repo_path_str],
                          check=True, capture_output=True, text=True)
         except subprocess.CalledProcessError as e:
             print(f"Failed to clone {actual_clone_url}: {e.stderr}")
@@ -49,18 +148,177 @@ def clone_repo(repo_url, repos_dir):
     else:
         print(f"Repository {repo_name} already exists. Skipping clone.")
 
-    return repo_path
+    return repo_path_str
 
-def should_ignore_line(line: str, ignore_patterns: List[str]) -> bool:
+def should_ignore_line(line: str, ignore_literals: Tuple[bytes, ...],
+                       ignore_regexes: Tuple[Pattern[str], ...]) -> bool:
     """Check if line should be ignored based on patterns"""
+    # Literal patterns are plain substring searches on the lowercased bytes,
+    # which need no regex engine at all
+    if ignore_literals:
+        line_bytes_lower = line.encode('utf-8', errors='replace').lower()
+        if any(literal in line_bytes_lower for literal in ignore_literals):
+            return True
+    return any(regex.search(line) for regex in ignore_regexes)
+
+@functools.lru_cache(maxsize=None)
+def ripgrep_supports_pcre2() -> bool:
+    """Check whether the installed ripgrep was built with PCRE2 support"""
+    try:
+        result = subprocess.run(['rg', '--pcre2-version'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return False
+    return result.returncode == 0
+
+def ripgrep_accepts_pattern(args: List[str]) -> bool:
+    """Check that ripgrep compiles a search, run against empty input"""
+    try:
+        result = subprocess.run(['rg', *args, '-'], input=b'', capture_output=True)
+    except FileNotFoundError:
+        return False
+    # 0 and 1 are match / no match; anything else is an error such as a bad pattern
+    return result.returncode <= 1
+
+def ripgrep_text(field: Dict[str, str]) -> str:
+    """Decode a ripgrep --json data field, which is either text or base64 bytes"""
+    if 'text' in field:
+        return field['text']
+    return base64.b64decode(field.get('bytes', '')).decode('utf-8', errors='replace')
+
+def ripgrep_bytes(field: Dict[str, str]) -> bytes:
+    """Return the raw bytes of a ripgrep --json data field, which submatch
+    offsets index into"""
+    if 'text' in field:
+        return field['text'].encode('utf-8')
+    return base64.b64decode(field.get('bytes', ''))
+
+# Number of candidate files passed to a single ripgrep invocation, keeping the
+# command line well below the OS argument size limit
+RIPGREP_FILE_BATCH = 500
+
+def find_candidate_files(repo_path: str, plan: Dict[str, Any], failures: List[str]) -> List[str]:
+    """List files containing any pattern as a plain literal (ripgrep -l -F)"""
+    result = subprocess.run((*plan['prefilter_cmd'], repo_path), capture_output=True)
+    if result.returncode > 1:  # 1 means "no matches found" which is OK
+        stderr = result.stderr.decode('utf-8', errors='replace')
+        print(f"Warning: ripgrep failed for {repo_path}: {stderr.strip()}")
+        failures.append(stderr.strip())
+
+    return [os.fsdecode(path) for path in result.stdout.split(b'\0') if path]
+
+def iter_ripgrep_matches(cmd: Tuple[str, ...], repo_path: str, failures: List[str]):
+    """Run ripgrep with --json and yield the data of each match event,
+    recording a failed run in failures"""
+    # Stream ripgrep's output one JSON event per line instead of buffering
+    # it all; stderr goes to a temporary file so a chatty rg cannot block
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file) as proc:
+            for line in proc.stdout:
+                if not line.strip():
+                    continue
+
+                event = json_loads(line)
+                if event.get('type') == 'match':
+                    yield event['data']
+
+        if proc.returncode > 1:  # 1 means "no matches found" which is OK
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace')
+            print(f"Warning: ripgrep failed for {repo_path}: {stderr.strip()}")
+            failures.append(stderr.strip())
+
+def is_ascii_word_char(char: str) -> bool:
+    """Check whether a character is a word character in ASCII and Unicode alike"""
+    return char.isascii() and (char.isalnum() or char == '_')
+
+def byte_mode_expression(pattern: str) -> str:
+    """Build a case-insensitive expression for a pattern matched over raw bytes,
+    as Hyperscan and ripgrep's PCRE2 --no-unicode mode do"""
+    # Caseless matching folds ASCII only, so spell out both cases of any
+    # other letter
+    expression = ''.join(
+        f'(?:{re.escape(char.lower())}|{re.escape(char.upper())})'
+        if not char.isascii() and char.lower() != char.upper()
+        and len(char.lower()) == len(char.upper()) == 1
+        else re.escape(char)
+        for char in pattern
+    )
+    # \b is ASCII-only over bytes, so it is only a coarse filter here: it is
+    # kept at edges that are ASCII word characters, and callers check the
+    # real Unicode boundaries of each match with is_word_bounded
+    if is_ascii_word_char(pattern[0]):
+        expression = rf'\b{expression}'
+    if is_ascii_word_char(pattern[-1]):
+        expression = rf'{expression}\b'
+    return expression
+
+def compile_hyperscan_database(patterns: List[str]) -> bytes:
+    """Compile word-bounded, case-insensitive patterns into a serialized Hyperscan database"""
+    # Hyperscan's UTF-8 mode requires valid UTF-8 input, so patterns are
+    # matched as bytes
+    expressions = [byte_mode_expression(pattern) for pattern in patterns]
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[expression.encode('utf-8') for expression in expressions],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns),
+    )
+    # Serialized so the plan can be pickled to worker processes
+    return hyperscan.dumpb(database)
+
+def compile_hyperscan_ignore_database(ignore_patterns: List[str]) -> Tuple[Optional[bytes], List[str]]:
+    """Compile ignore patterns for Hyperscan, returning the serialized database
+    and the patterns Hyperscan cannot handle"""
+    # The database is scanned one line at a time, so each pattern only needs
+    # to report whether it matched at all
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+
+    supported = []
+    unsupported = []
     for pattern in ignore_patterns:
-        if re.search(pattern, line, re.IGNORECASE):
+        try:
+            hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK).compile(
+                expressions=[pattern.encode('utf-8')], ids=[0], elements=1, flags=[flags])
+        except hyperscan.error:
+            unsupported.append(pattern)
+        else:
+            supported.append(pattern)
+
+    if not supported:
+        return None, unsupported
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[expression.encode('utf-8') for expression in supported],
+        ids=list(range(len(supported))),
+        elements=len(supported),
+        flags=[flags] * len(supported),
+    )
+    return hyperscan.dumpb(database), unsupported
+
+def glob_regex(globs: List[str]) -> Optional[Pattern[str]]:
+    """Combine shell-style file name globs into a single regex"""
+    if not globs:
+        return None
+    return re.compile('|'.join(fnmatch.translate(glob) for glob in globs))
+
+def patterns_overlap(first: str, second: str) -> bool:
+    """Check whether second can match inside first or run on from its end,
+    as 'hitler' does in 'heil hitler' and 'hitler youth' does after it"""
+    second_regex = re.compile(rf'\b{re.escape(second)}\b', re.IGNORECASE)
+    if second_regex.search(first):
+        return True
+    for start in range(1, len(first)):
+        overlap = first[start:]
+        if second.startswith(overlap) and second_regex.match(first + second[len(overlap):], start):
             return True
     return False
 
-def scan_with_ripgrep(repo_path: str, patterns: Dict[str, Any], config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Use ripgrep to scan for patterns"""
-    findings = []
+def build_scan_plan(config: Dict[str, Any], engine: str = 'ripgrep') -> Dict[str, Any]:
+    """Build the scan commands and pattern lookup once for all repositories"""
+    patterns = config.get('categories', {})
 
     # Build file type arguments for ripgrep
     type_args = []
@@ -75,119 +333,474 @@ def scan_with_ripgrep(repo_path: str, patterns: Dict[str, Any], config: Dict[str
     for exclude_file in config.get('exclude_files', []):
         type_args.extend(['-g', f'!{exclude_file}'])
 
-    ignore_patterns = config.get('ignore_line_patterns', [])
+    # Freeze once; every command built from the plan shares this tuple
+    type_args = tuple(type_args)
 
+    ignore_literals = config.get('_ignore_literals', ())
+    ignore_regexes = config.get('_ignore_regexes', ())
+
+    # Map each pattern back to every category listing it; ripgrep runs case
+    # insensitive, so matched text is looked up lowercased. A pattern shared
+    # by several categories is searched for once and fanned out afterwards.
+    pattern_to_categories = {}
     for category, category_data in patterns.items():
-        print(f"  Scanning for {category} ({category_data.get('description', '')})...")
-        category_patterns = category_data.get('patterns', [])
+        for pattern in category_data.get('patterns', []):
+            entries = pattern_to_categories.setdefault(pattern.lower(), [])
+            if (category, pattern) not in entries:
+                entries.append((category, pattern))
+
+    # One spelling per distinct pattern is enough to search for
+    unique_patterns = [entries[0][1] for entries in pattern_to_categories.values()]
+
+    # In-process Hyperscan is opt-in; ripgrep stays the reference engine
+    hyperscan_db = None
+    if engine == 'hyperscan':
+        if hyperscan is None:
+            print("Error: Hyperscan is not installed. Please run: pip install hyperscan")
+            exit(1)
+        if unique_patterns:
+            try:
+                hyperscan_db = compile_hyperscan_database(unique_patterns)
+            except hyperscan.error as e:
+                print(f"Error: Could not compile patterns for Hyperscan: {e}")
+                exit(1)
+    engine = 'hyperscan' if hyperscan_db is not None else 'ripgrep'
+
+    # With Hyperscan, ignore patterns run as a second database; only the
+    # patterns it cannot compile are left to the Python regex
+    hyperscan_ignore_db = None
+    if engine == 'hyperscan' and config.get('ignore_line_patterns'):
+        hyperscan_ignore_db, unsupported = compile_hyperscan_ignore_database(config['ignore_line_patterns'])
+        # Literals always compile, so only regexes can be left over
+        ignore_literals = ()
+        ignore_regexes = compile_ignore_patterns(unsupported)
+
+    # Combine every pattern into one word-bounded alternation so ripgrep makes
+    # a single pass over each file. Longer patterns go first so that a pattern
+    # sharing a prefix with a shorter one wins at the same position.
+    alternation = '|'.join(re.escape(pattern) for pattern in sorted(unique_patterns, key=len, reverse=True))
+    joined_pattern = rf'\b(?:{alternation})\b'
+
+    # The alternation reports one pattern per stretch of text, hiding any
+    # pattern inside or overlapping a match. Note which patterns overlap so
+    # the lines they are found on can be re-checked for the hidden ones.
+    overlapping_patterns = {}
+    for first in pattern_to_categories:
+        for second in pattern_to_categories:
+            if first != second and patterns_overlap(first, second):
+                for key, other in ((first, second), (second, first)):
+                    other_regex = re.compile(rf'\b{re.escape(other)}\b', re.IGNORECASE)
+                    entries = overlapping_patterns.setdefault(key, [])
+                    if all(entry[0] != other for entry in entries):
+                        entries.append((other, other_regex))
+
+    # With PCRE2 available, push the ignore filter into ripgrep so ignored lines
+    # never reach Python: the first match on a line must start at a line that
+    # matches none of the ignore patterns, and later matches continue from the
+    # previous one (\G). \K keeps the reported submatch to the pattern itself.
+    #
+    # PCRE2 runs over raw bytes (--no-unicode): in Unicode mode .*? cannot step
+    # over invalid UTF-8, losing matches in Latin-1 files. Patterns are built
+    # as for Hyperscan and their word boundaries checked in Python. Patterns
+    # that cannot share an alternation, or non-ASCII ignore patterns, which
+    # would lose case folding, stay with the Python filter.
+    engine_args = []
+    ignore_patterns = config.get('ignore_line_patterns', [])
+    fusable = all(pattern.isascii() and can_fuse_ignore_pattern(pattern, re.compile(pattern))
+                  for pattern in ignore_patterns)
+    if engine == 'ripgrep' and unique_patterns and ignore_patterns and fusable and ripgrep_supports_pcre2():
+        ignore_alternation = '|'.join(f'(?:{pattern})' for pattern in ignore_patterns)
+        byte_alternation = '|'.join(byte_mode_expression(pattern)
+                                    for pattern in sorted(unique_patterns, key=len, reverse=True))
+        pushed_pattern = rf'(?m)(?:^(?!.*(?:{ignore_alternation}))|\G(?!^)).*?\K(?:{byte_alternation})'
+        # Ignore patterns are written for Python's re; keep the Python-side
+        # filter for any that PCRE2 cannot compile
+        if ripgrep_accepts_pattern(['-P', '--no-unicode', '-i', '-e', pushed_pattern]):
+            joined_pattern = pushed_pattern
+            engine_args = ['-P', '--no-unicode']
+            ignore_literals = ()
+            ignore_regexes = ()
+        else:
+            print("Warning: ignore_line_patterns do not compile as PCRE2, filtering ignored lines in Python")
+
+    # ASCII-only patterns do not need Unicode case folding; turning it off
+    # keeps ripgrep's case-insensitive automaton small. Only the literals are
+    # switched to ASCII mode (?-u:...) so \b still treats accented letters as
+    # part of a word.
+    if not engine_args:
+        ascii_alternation = '|'.join(
+            f'(?-u:{re.escape(pattern)})' if pattern.isascii() else re.escape(pattern)
+            for pattern in sorted(unique_patterns, key=len, reverse=True)
+        )
+        joined_pattern = rf'\b(?:{ascii_alternation})\b'
+
+    # The literal prefilter has no word boundaries, so it can drop Unicode
+    # outright
+    unicode_args = []
+    if all(pattern.isascii() for pattern in unique_patterns):
+        unicode_args = ['--no-unicode']
+
+    prefilter_cmd = (
+        'rg', '-l', '-F', '-i', '--null', *unicode_args,
+        *(arg for literal in unique_patterns for arg in ('-e', literal)),
+        *type_args
+    )
+
+    scan_cmd = (
+        'rg',
+        '--json',
+        '-i',  # Case insensitive
+        *engine_args,
+        '-e', joined_pattern,
+        '--'
+    )
+
+    # Hash the user-facing configuration (not the compiled _ entries) and the
+    # engine so cached scan results are invalidated whenever either changes
+    public_config = {key: value for key, value in config.items() if not key.startswith('_')}
+    config_hash = hashlib.sha256(json.dumps([public_config, engine], sort_keys=True).encode('utf-8')).hexdigest()
+
+    return {
+        'engine': engine,
+        'config_hash': config_hash,
+        'pattern_to_categories': pattern_to_categories,
+        'overlapping_patterns': overlapping_patterns,
+        'ignore_literals': ignore_literals,
+        'ignore_regexes': ignore_regexes,
+        # Byte-mode matches only approximate \b and are checked in Python
+        'check_word_bounds': bool(engine_args),
+        'prefilter_cmd': prefilter_cmd,
+        'scan_cmd': scan_cmd,
+        # Hyperscan database ids index into hyperscan_keys
+        'hyperscan_db': hyperscan_db,
+        'hyperscan_ignore_db': hyperscan_ignore_db,
+        'hyperscan_keys': [pattern.lower() for pattern in unique_patterns],
+        'include_regex': glob_regex([f'*{ext}' for ext in config.get('file_extensions', [])]),
+        'exclude_dirs': frozenset(config.get('exclude_dirs', [])),
+        'exclude_file_regex': glob_regex(config.get('exclude_files', [])),
+    }
+
+def find_on_line(line: str, candidates: List[Tuple[str, Pattern[str]]]) -> List[Tuple[str, str]]:
+    """Find which (key, regex) candidates occur on a line, with their matched text"""
+    found = []
+    for key, regex in candidates:
+        match = regex.search(line)
+        if match:
+            found.append((key, match.group()))
+    return found
+
+def scan_with_ripgrep(repo_path: str, plan: Dict[str, Any], failures: List[str]) -> List[Finding]:
+    """Use ripgrep to scan for all patterns in a single pass"""
+    findings = []
 
-        for pattern in category_patterns:
-            # Use word boundaries for better matching
-            word_pattern = rf'\b{re.escape(pattern)}\b'
+    pattern_to_categories = plan['pattern_to_categories']
+    overlapping_patterns = plan['overlapping_patterns']
+    check_word_bounds = plan['check_word_bounds']
+    ignore_literals = plan['ignore_literals']
+    ignore_regexes = plan['ignore_regexes']
 
-            try:
-                # Run ripgrep with the pattern
-                cmd = [
-                    'rg',
-                    '--line-number',
-                    '--no-heading',
-                    '-i',  # Case insensitive
-                    '--color', 'never',
-                    word_pattern
-                ] + type_args + [repo_path]
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-
-                if result.returncode == 0:  # Found matches
-                    for line in result.stdout.strip().split('\n'):
-                        if not line:
+    if not pattern_to_categories:
+        return findings
+
+    try:
+        # Stage 1: a cheap literal scan finds the few files that can match at
+        # all; stage 2 runs the full word-bounded regex over only those files
+        candidate_files = find_candidate_files(repo_path, plan, failures)
+        print(f"  Found {len(candidate_files)} candidate files")
+
+        for start in range(0, len(candidate_files), RIPGREP_FILE_BATCH):
+            cmd = (*plan['scan_cmd'], *candidate_files[start:start + RIPGREP_FILE_BATCH])
+
+            for data in iter_ripgrep_matches(cmd, repo_path, failures):
+                file_path = ripgrep_text(data['path'])
+                line_number = data['line_number']
+                line_content = ripgrep_text(data['lines']).rstrip('\n')
+
+                # Check if line should be ignored
+                if should_ignore_line(line_content, ignore_literals, ignore_regexes):
+                    continue
+
+                if check_word_bounds:
+                    line_bytes = ripgrep_bytes(data['lines'])
+
+                seen = set()
+                for submatch in data['submatches']:
+                    matched_text = ripgrep_text(submatch['match'])
+                    key = matched_text.lower()
+                    if key not in pattern_to_categories:
+                        continue
+
+                    # Patterns overlapping a match may have been hidden by
+                    # it, so look for them on the line; hits grows as more
+                    # are found. A byte-mode match that is not a whole word
+                    # can still hide one.
+                    if check_word_bounds and not is_word_bounded(line_bytes, submatch['start'], submatch['end']):
+                        hits = find_on_line(line_content, overlapping_patterns.get(key, ()))
+                    else:
+                        hits = [(key, matched_text)]
+                    for hit_key, hit_text in hits:
+                        if hit_key in seen:
                             continue
+                        seen.add(hit_key)
 
-                        # Parse ripgrep output: filepath:line_number:line_content
-                        parts = line.split(':', 2)
-                        if len(parts) >= 3:
-                            file_path = parts[0]
-                            line_number = parts[1]
-                            line_content = parts[2]
-
-                            # Check if line should be ignored
-                            if should_ignore_line(line_content, ignore_patterns):
-                                continue
-
-                            # Find the actual matched text
-                            match = re.search(word_pattern, line_content, re.IGNORECASE)
-                            matched_text = match.group() if match else pattern
-
-                            findings.append({
-                                "file_path": file_path,
-                                "line_number": int(line_number),
-                                "category": category,
-                                "pattern_found": pattern,
-                                "line_content": line_content.strip(),
-                                "matched_text": matched_text
-                            })
-
-            except subprocess.CalledProcessError as e:
-                if e.returncode != 1:  # 1 means "no matches found" which is OK
-                    print(f"Warning: ripgrep failed for pattern '{pattern}': {e}")
-            except FileNotFoundError:
-                print("Error: ripgrep (rg) not found. Please install ripgrep.")
-                print("  macOS: brew install ripgrep")
-                print("  Ubuntu/Debian: apt install ripgrep")
-                exit(1)
+                        for category, pattern in pattern_to_categories[hit_key]:
+                            findings.append(Finding(
+                                file_path=file_path,
+                                line_number=line_number,
+                                category=category,
+                                pattern_found=pattern,
+                                line_content=line_content.strip(),
+                                matched_text=hit_text
+                            ))
+
+                        hits.extend(find_on_line(line_content, overlapping_patterns.get(hit_key, ())))
+
+    except FileNotFoundError:
+        print("Error: ripgrep (rg) not found. Please install ripgrep.")
+        print("  macOS: brew install ripgrep")
+        print("  Ubuntu/Debian: apt install ripgrep")
+        exit(1)
 
     return findings
 
-def scan_repository(repo_path: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Scan a single repository"""
-    patterns = config.get('categories', {})
+def iter_scan_files(repo_path: str, plan: Dict[str, Any]):
+    """Walk a repository yielding files to scan, applying the configured filters"""
+    include_regex = plan['include_regex']
+    exclude_dirs = plan['exclude_dirs']
+    exclude_file_regex = plan['exclude_file_regex']
+
+    for root, dirs, files in os.walk(repo_path):
+        # Like ripgrep, skip hidden and excluded directories, and hidden files
+        # unless an include glob names them explicitly
+        dirs[:] = [name for name in dirs if not name.startswith('.') and name not in exclude_dirs]
+        for name in files:
+            if include_regex is not None:
+                if not include_regex.match(name):
+                    continue
+            elif name.startswith('.'):
+                continue
+            if exclude_file_regex is not None and exclude_file_regex.match(name):
+                continue
+            yield os.path.join(root, name)
+
+# Hyperscan databases loaded in this process, keyed by their serialized bytes
+# so a different plan never picks up a stale database
+_hyperscan_databases: Dict[bytes, Any] = {}
+
+def get_hyperscan_database(plan: Dict[str, Any], name: str):
+    """Load one of the plan's serialized Hyperscan databases, once per process"""
+    serialized = plan[name]
+    if serialized is None:
+        return None
+    if serialized not in _hyperscan_databases:
+        database = hyperscan.loadb(serialized, hyperscan.HS_MODE_BLOCK)
+        database.scratch = hyperscan.Scratch(database)
+        _hyperscan_databases[serialized] = database
+    return _hyperscan_databases[serialized]
+
+# Python's \w, matching the word boundaries the Python-side checks use
+WORD_CHAR_REGEX = re.compile(r'\w')
+
+def is_word_char(char: str) -> bool:
+    """Check whether a character (or '' past either end) is a Unicode word character"""
+    return WORD_CHAR_REGEX.match(char) is not None
+
+def is_word_bounded(data: bytes, start: int, end: int) -> bool:
+    """Check that data[start:end] is bounded by Unicode word boundaries (\b)"""
+    # A character is at most four bytes, so a few bytes either side suffice
+    before = data[max(0, start - 4):start].decode('utf-8', errors='replace')[-1:]
+    after = data[end:end + 4].decode('utf-8', errors='replace')[:1]
+    matched = data[start:end].decode('utf-8', errors='replace')
+    return (is_word_char(before) != is_word_char(matched[0])
+            and is_word_char(matched[-1]) != is_word_char(after))
+
+def scan_with_hyperscan(repo_path: str, plan: Dict[str, Any], failures: List[str]) -> List[Finding]:
+    """Use Hyperscan to scan for all patterns in a single pass over each file"""
+    findings = []
+
+    database = get_hyperscan_database(plan, 'hyperscan_db')
+    ignore_database = get_hyperscan_database(plan, 'hyperscan_ignore_db')
+    hyperscan_keys = plan['hyperscan_keys']
+    pattern_to_categories = plan['pattern_to_categories']
+    ignore_literals = plan['ignore_literals']
+    ignore_regexes = plan['ignore_regexes']
+
+    file_count = 0
+    for file_path in iter_scan_files(repo_path, plan):
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            # ripgrep reports unreadable files as an error too
+            failures.append(str(e))
+            continue
+
+        # ripgrep skips binary files; treat a NUL byte the same way
+        if b'\0' in data:
+            continue
+        file_count += 1
+
+        matches = []
+        database.scan(data, match_event_handler=lambda pattern_id, start, end, flags, context:
+                      matches.append((start, end, pattern_id)))
+        if not matches:
+            continue
 
-    print(f"Scanning repository: {os.path.basename(repo_path)}")
+        # Like ripgrep_text, replace bytes of a non-UTF-8 file name so the
+        # reports can always be encoded
+        finding_path = os.fsencode(file_path).decode('utf-8', errors='replace')
+
+        # Walk matches in file order, counting newlines incrementally
+        matches.sort()
+        line_number = 1
+        position = 0
+        current_line_start = -1
+        for start, end, pattern_id in matches:
+            if not is_word_bounded(data, start, end):
+                continue
+
+            line_number += data.count(b'\n', position, start)
+            position = start
+
+            line_start = data.rfind(b'\n', 0, start) + 1
+            if line_start != current_line_start:
+                current_line_start = line_start
+                line_end = data.find(b'\n', start)
+                if line_end == -1:
+                    line_end = len(data)
+                line_content = data[line_start:line_end].decode('utf-8', errors='replace')
+
+                # Only lines with a match pay for the ignore scan, run over the
+                # line alone so no ignore pattern can match across lines
+                ignore_hits = []
+                if ignore_database is not None:
+                    ignore_database.scan(data[line_start:line_end],
+                                         match_event_handler=lambda pattern_id, start, end, flags, context:
+                                         ignore_hits.append(pattern_id))
+                ignored = bool(ignore_hits) or should_ignore_line(line_content, ignore_literals, ignore_regexes)
+                seen = set()
+
+            key = hyperscan_keys[pattern_id]
+            if ignored or key in seen:
+                continue
+            seen.add(key)
+
+            matched_text = data[start:end].decode('utf-8', errors='replace')
+            for category, pattern in pattern_to_categories[key]:
+                findings.append(Finding(
+                    file_path=finding_path,
+                    line_number=line_number,
+                    category=category,
+                    pattern_found=pattern,
+                    line_content=line_content.strip(),
+                    matched_text=matched_text
+                ))
+
+    print(f"  Searched {file_count} files")
+    return findings
 
-    # Count files first for progress
+def repo_head_sha(repo_path: str) -> Optional[str]:
+    """Return the commit SHA checked out in a repository, or None if unknown"""
     try:
-        find_cmd = ['find', repo_path, '-type', 'f']
-        # Add file extension filters
-        ext_filters = []
-        for ext in config.get('file_extensions', []):
-            ext_filters.extend(['-name', f'*{ext}', '-o'])
-        if ext_filters:
-            ext_filters = ext_filters[:-1]  # Remove last '-o'
-            find_cmd.extend(['('] + ext_filters + [')'])
-
-        result = subprocess.run(find_cmd, capture_output=True, text=True)
-        file_count = len([line for line in result.stdout.strip().split('\n') if line])
-        print(f"  Found {file_count} files to scan...")
-    except:
-        print("  Scanning files...")
-
-    findings = scan_with_ripgrep(repo_path, patterns, config)
+        result = subprocess.run(['git', '-C', repo_path, 'rev-parse', 'HEAD'],
+                                capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+def scan_cache_path(repo_path: str, plan: Dict[str, Any], cache_dir: str) -> Optional[Path]:
+    """Return the cache file for a repository's current commit and config"""
+    sha = repo_head_sha(repo_path)
+    if sha is None:
+        return None
+    # Findings embed the repository path, so it is part of the key as well
+    key = hashlib.sha256(f"{plan['config_hash']}\0{Path(repo_path).resolve()}".encode('utf-8')).hexdigest()
+    return Path(cache_dir) / f"{sha}_{key}.json"
+
+def scan_repository_cached(repo_path: str, config: Dict[str, Any], plan: Dict[str, Any],
+                           cache_dir: Optional[str]) -> List[Finding]:
+    """Scan a repository, reusing cached findings for an unchanged commit and config"""
+    cache_file = scan_cache_path(repo_path, plan, cache_dir) if cache_dir else None
+
+    if cache_file is not None and cache_file.exists():
+        try:
+            findings = [Finding(**finding) for finding in json_loads(cache_file.read_bytes())]
+        except (ValueError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable scan cache {cache_file}: {e}")
+        else:
+            print(f"Scanning repository: {Path(repo_path).name}")
+            print(f"  Loaded {len(findings)} cached issues")
+            return findings
+
+    failures = []
+    findings = scan_repository(repo_path, config, plan, failures)
+
+    # A scan that hit errors may be missing findings, so it is not cached
+    if cache_file is not None and not failures:
+        # Write through a temporary file so a concurrent reader never sees a
+        # partial cache entry
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=cache_file.parent, delete=False) as f:
+            f.write(json_dumps([finding._asdict() for finding in findings]))
+        os.replace(f.name, cache_file)
+
+    return findings
+
+def scan_repository(repo_path: str, config: Dict[str, Any], plan: Dict[str, Any],
+                    failures: Optional[List[str]] = None) -> List[Finding]:
+    """Scan a single repository, recording any scan errors in failures"""
+    if failures is None:
+        failures = []
+    patterns = config.get('categories', {})
+
+    print(f"Scanning repository: {Path(repo_path).name}")
+    for category, category_data in patterns.items():
+        print(f"  Scanning for {category} ({category_data.get('description', '')})...")
+
+    if plan['engine'] == 'hyperscan':
+        findings = scan_with_hyperscan(repo_path, plan, failures)
+    else:
+        findings = scan_with_ripgrep(repo_path, plan, failures)
 
     print(f"  Found {len(findings)} total issues")
     return findings
 
-def convert_json_to_csv(json_file, csv_file, report):
-    """Converts a JSON report of problematic content to a CSV file."""
-    # Define CSV headers
-    fieldnames = ["repository", "file_path", "line_number", "category", "pattern_found", "line_content", "matched_text"]
-
-    with open(csv_file, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for repo_name, findings in report.items():
-            for finding in findings:
-                row = {
-                    "repository": repo_name,
-                    "file_path": finding.get("file_path", ""),
-                    "line_number": finding.get("line_number", ""),
-                    "category": finding.get("category", ""),
-                    "pattern_found": finding.get("pattern_found", ""),
-                    "line_content": finding.get("line_content", ""),
-                    "matched_text": finding.get("matched_text", "")
-                }
-                writer.writerow(row)
-    print(f"Conversion complete. Report saved to {csv_file}")
+# Configuration, scan plan and cache directory shared by scan worker processes,
+# set once per worker by init_scan_worker so they are not pickled again for
+# every repository
+_worker_config: Dict[str, Any] = {}
+_worker_plan: Dict[str, Any] = {}
+_worker_cache_dir: Optional[str] = None
+
+def init_scan_worker(config: Dict[str, Any], plan: Dict[str, Any], cache_dir: Optional[str]):
+    """Store the scan configuration, plan and cache directory in a worker process"""
+    global _worker_config, _worker_plan, _worker_cache_dir
+    _worker_config = config
+    _worker_plan = plan
+    _worker_cache_dir = cache_dir
+
+def scan_repository_worker(repo_path: str) -> List[Finding]:
+    """Scan a single repository inside a worker process"""
+    return scan_repository_cached(repo_path, _worker_config, _worker_plan, _worker_cache_dir)
+
+# CSV report headers
+CSV_FIELDNAMES = ["repository", "file_path", "line_number", "category", "pattern_found", "line_content", "matched_text"]
+
+def write_json_entry(f, repo_name: str, findings: List[Finding], first: bool):
+    """Append one repository's findings to a JSON report opened with '{'"""
+    # Indented to match a two-space indented dump of the whole report.
+    # Findings are named tuples, which json would write as plain lists.
+    findings_json = json_dumps_indented([finding._asdict() for finding in findings])
+    f.write(b'\n' if first else b',\n')
+    f.write(b'  ' + json_dumps_indented(repo_name) + b': ')
+    f.write(findings_json.replace(b'\n', b'\n  '))
+
+def write_csv_rows(writer, repo_name: str, findings: List[Finding]):
+    """Write one repository's findings to the CSV report"""
+    # Finding fields are already in CSV_FIELDNAMES order after the repository
+    writer.writerows((repo_name, *finding) for finding in findings)
 
 def fetch_repos_from_file(file_path):
     """
@@ -218,8 +831,8 @@ def fetch_repos_from_file(file_path):
 
 
 def main():
-    script_dir = os.path.dirname(os.path.realpath(__file__))
-    default_config_path = os.path.join(script_dir, 'simple_config.json')
+    script_dir = Path(__file__).resolve().parent
+    default_config_path = str(script_dir / 'simple_config.json')
 
     parser = argparse.ArgumentParser(description="Enhanced repository content scanner")
     parser.add_argument("--file", type=str, required=True, help="Path to a CSV or TXT file with a list of repository URLs.")
@@ -228,14 +841,21 @@ def main():
     parser.add_argument("--output", type=str, default="enhanced_content_report", help="Base name for output files (e.g., 'my_scan' will produce 'my_scan.json' and 'my_scan.csv')")
     parser.add_argument("--repos-dir", type=str, default="repos/cloned", help="Directory to clone repositories into.")
     parser.add_argument("--results-dir", type=str, default="enhanced_results", help="Directory to save scan reports.")
+    parser.add_argument("--cache-dir", type=str, default="repos/scan_cache",
+                       help="Directory for cached findings, keyed by repository commit and configuration.")
+    parser.add_argument("--no-cache", action="store_true", help="Always rescan repositories and do not write the scan cache.")
+    parser.add_argument("--engine", choices=["ripgrep", "hyperscan"], default="ripgrep",
+                       help="Matching engine; 'hyperscan' scans in-process and requires the hyperscan package.")
 
     args = parser.parse_args()
 
-    # Load configuration
+    # Load configuration and build the ripgrep commands shared by every scan
     config = load_config(args.config)
+    plan = build_scan_plan(config, args.engine)
 
     # Create results directory
-    os.makedirs(args.results_dir, exist_ok=True)
+    results_dir = Path(args.results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
 
     # Determine repositories to scan
     repos_to_scan = fetch_repos_from_file(args.file)
@@ -245,7 +865,7 @@ def main():
         return
 
     # Ensure repos directory exists
-    os.makedirs(args.repos_dir, exist_ok=True)
+    Path(args.repos_dir).mkdir(parents=True, exist_ok=True)
 
     # Show configuration summary
     total_patterns = sum(len(cat_data.get('patterns', [])) for cat_data in config.get('categories', {}).values())
@@ -253,50 +873,89 @@ def main():
     print(f"  Categories: {len(config.get('categories', {}))}")
     print(f"  Total patterns: {total_patterns}")
     print(f"  File extensions: {len(config.get('file_extensions', []))}")
-    print(f"  Using ripgrep for fast scanning")
+    print(f"  Using {plan['engine']} for fast scanning")
     print()
 
-    # Scan repositories
-    report = {}
+    # Clone repositories in parallel; cloning is network bound
+    repo_names = []
+    repo_urls = []
     for repo in repos_to_scan:
         repo_url = repo.get("url")
         if not repo_url:
             continue
+        repo_names.append(repo.get('name', repo_url.split('/')[-1].replace('.git', '')))
+        repo_urls.append(repo_url)
+
+    # URLs sharing a target directory (the same repository, or two owners'
+    # repositories with the same name) are cloned one after another, so
+    # parallel clones never write to the same directory
+    clone_groups = {}
+    for repo_url in dict.fromkeys(repo_urls):
+        clone_groups.setdefault(repo_clone_path(repo_url, args.repos_dir), []).append(repo_url)
+
+    def clone_group(urls):
+        return [(url, clone_repo(url, args.repos_dir)) for url in urls]
+
+    clone_paths = {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for results in executor.map(clone_group, clone_groups.values()):
+            clone_paths.update(results)
+    print()
 
-        repo_name = repo.get('name', repo_url.split('/')[-1].replace('.git', ''))
-        repo_path = clone_repo(repo_url, args.repos_dir)
-
-        if repo_path:
-            findings = scan_repository(repo_path, config)
-            if findings:
-                report[repo_name] = findings
-            else:
-                print(f"  No issues found in {repo_name}")
-            print()
-
-    # Save reports
-    json_output_file = os.path.join(args.results_dir, f"{args.output}.json")
-    csv_output_file = os.path.join(args.results_dir, f"{args.output}.csv")
+    cloned = [(name, clone_paths[url]) for name, url in zip(repo_names, repo_urls) if clone_paths[url]]
+
+    # Reports are written in the order repositories finish, so only results
+    # that have not been written yet are held in memory
+    json_output_file = results_dir / f"{args.output}.json"
+    csv_output_file = results_dir / f"{args.output}.csv"
+
+    written = set()
+    category_counts = {}
+    with open(json_output_file, 'wb') as json_file, \
+            open(csv_output_file, "w", encoding="utf-8", newline="") as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(CSV_FIELDNAMES)
+        json_file.write(b'{')
+
+        # Scan repositories in parallel, one repository per worker process
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_scan_worker,
+                                 initargs=(config, plan, None if args.no_cache else args.cache_dir)) as executor:
+            # The first repository listed under a name is the one reported
+            futures = {}
+            submitted = set()
+            for repo_name, repo_path in cloned:
+                if repo_name in submitted:
+                    print(f"  Skipping duplicate repository name {repo_name}")
+                    continue
+                submitted.add(repo_name)
+                futures[executor.submit(scan_repository_worker, repo_path)] = repo_name
+
+            for future in as_completed(futures):
+                repo_name = futures[future]
+                findings = future.result()
+                if not findings:
+                    print(f"  No issues found in {repo_name}")
+                    continue
+
+                write_json_entry(json_file, repo_name, findings, first=not written)
+                write_csv_rows(csv_writer, repo_name, findings)
+                written.add(repo_name)
+
+                for finding in findings:
+                    category_counts[finding.category] = category_counts.get(finding.category, 0) + 1
+
+        json_file.write(b'\n}' if written else b'}')
+    print()
 
-    with open(json_output_file, 'w') as f:
-        json.dump(report, f, indent=2)
     print(f"Scan complete. JSON report saved to {json_output_file}")
-
-    convert_json_to_csv(json_output_file, csv_output_file, report)
-
+    print(f"CSV report saved to {csv_output_file}")
 
     # Summary
-    total_findings = sum(len(findings) for findings in report.values())
+    total_findings = sum(category_counts.values())
     print(f"Total issues found: {total_findings}")
 
     # Show breakdown by category
     if total_findings > 0:
-        category_counts = {}
-        for findings in report.values():
-            for finding in findings:
-                category = finding['category']
-                category_counts[category] = category_counts.get(category, 0) + 1
-
         print("\nBreakdown by category:")
         for category, count in category_counts.items():
             print(f"  {category}: {count} issues")
@@ -3,36 +3,47 @@ import json
 import csv
 import os
 
+try:
+    import ijson  # Optional: stream large reports instead of loading them whole
+except ImportError:
+    ijson = None
+
 JSON_FILE = "problematic_content_report_open-dev-data.git.json"
 CSV_FILE = "problematic_content_report_open-dev-data.csv"
 
+def iter_report(f):
+    """Yields (repo_name, findings) pairs from a JSON report opened in binary mode."""
+    if ijson is not None:
+        # Only one repository's findings are held in memory at a time
+        yield from ijson.kvitems(f, "")
+    else:
+        yield from json.load(f).items()
+
 def convert_json_to_csv(json_file, csv_file):
     """Converts a JSON report of problematic content to a CSV file."""
     if not os.path.exists(json_file):
         print(f"Error: JSON report file not found at {json_file}")
         return
 
-    with open(json_file, "r", encoding="utf-8") as f:
-        report = json.load(f)
-
     # Define CSV headers
     fieldnames = ["repository", "file_path", "line_number", "category", "pattern_found", "line_content"]
 
-    with open(csv_file, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for repo_name, findings in report.items():
-            for finding in findings:
-                row = {
-                    "repository": repo_name,
-                    "file_path": finding.get("file_path", ""),
-                    "line_number": finding.get("line_number", ""),
-                    "category": finding.get("category", ""),
-                    "pattern_found": finding.get("pattern_found", ""),
-                    "line_content": finding.get("line_content", "")
-                }
-                writer.writerow(row)
+    with open(json_file, "rb") as report_file, open(csv_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+
+        for repo_name, findings in iter_report(report_file):
+            writer.writerows(
+                (
+                    repo_name,
+                    finding.get("file_path", ""),
+                    finding.get("line_number", ""),
+                    finding.get("category", ""),
+                    finding.get("pattern_found", ""),
+                    finding.get("line_content", "")
+                )
+                for finding in findings
+            )
     print(f"Conversion complete. Report saved to {csv_file}")
 
 if __name__ == "__main__":